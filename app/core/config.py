@@ -11,6 +11,21 @@ class Settings(BaseSettings):
     MAX_TEXT_CHARS: int = 2000
     MAX_BODY_BYTES: int = 262144
     PREDICT_TIMEOUT_MS: int = 1500
+    INFERENCE_WORKERS: int = 2
+    INFERENCE_QUEUE_SIZE: int = 32
+    RETRY_AFTER_SECONDS: int = 1
+    BATCH_ENABLED: bool = False
+    BATCH_MAX_SIZE: int = 64
+    BATCH_MAX_WAIT_MS: float = 2.0
+    BATCH_MAX_PENDING: int = 1024
+    PREDICTION_CACHE_MAX_BYTES: int = 16777216
+    PREDICTION_CACHE_TTL_SECONDS: float = 0.0
+    INFERENCE_BACKEND: str = "auto"
+    ADMIN_TOKEN: Optional[str] = None
+    MODEL_WATCH_INTERVAL_S: float = 0.0
+    MODEL_REGISTRY_DIR: Optional[str] = None
+    MODEL_REGISTRY_MAX_BYTES: int = 1073741824
+    STREAM_CHUNK_SIZE: int = 256
 
 
 def get_settings() -> Settings:
@@ -1,32 +1,74 @@
 import json
 import logging
 import os
+import secrets
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from concurrent.futures import TimeoutError
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from typing import AsyncIterator, Optional
 from uuid import uuid4
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
 
 from app.core.config import get_settings
 from app.schemas import (
     HealthResponse,
+    PredictBatchItem,
     PredictBatchRequest,
     PredictBatchResponse,
     PredictRequest,
     PredictResponse,
     ReadyResponse,
+    ReloadRequest,
+    ReloadResponse,
 )
-from app.services.predictor import Predictor
+from app.services.batcher import MicroBatcher
+from app.services.executor import InferenceExecutor, QueueFullError
+from app.services.predictor import PredictionCache, Predictor
+from app.services.registry import ModelNotFoundError, ModelRegistry
+from app.services.reloader import ModelReloader, ReloadInProgressError
 
 logger = logging.getLogger(__name__)
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(level=LOG_LEVEL, format="%(message)s")
 
-predictor = Predictor()
 settings = get_settings()
+predictor = Predictor(
+    cache=PredictionCache(
+        max_bytes=settings.PREDICTION_CACHE_MAX_BYTES,
+        ttl_seconds=settings.PREDICTION_CACHE_TTL_SECONDS,
+    )
+    if settings.PREDICTION_CACHE_MAX_BYTES > 0
+    else None,
+    backend=settings.INFERENCE_BACKEND,
+)
+inference_executor = InferenceExecutor(
+    max_workers=settings.INFERENCE_WORKERS, max_queue=settings.INFERENCE_QUEUE_SIZE
+)
+model_reloader = ModelReloader(predictor)
+model_registry = (
+    ModelRegistry(
+        settings.MODEL_REGISTRY_DIR,
+        max_bytes=settings.MODEL_REGISTRY_MAX_BYTES,
+        backend=settings.INFERENCE_BACKEND,
+    )
+    if settings.MODEL_REGISTRY_DIR
+    else None
+)
+micro_batcher = (
+    MicroBatcher(
+        predictor,
+        max_batch_size=settings.BATCH_MAX_SIZE,
+        max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+        max_pending=settings.BATCH_MAX_PENDING,
+    )
+    if settings.BATCH_ENABLED
+    else None
+)
 
 
 @asynccontextmanager
@@ -36,7 +78,13 @@ async def lifespan(app: FastAPI):
             predictor.load(settings.MODEL_DIR)
         except Exception:
             logger.exception("Failed to load model from MODEL_DIR")
+        if settings.MODEL_WATCH_INTERVAL_S > 0:
+            model_reloader.watch(settings.MODEL_DIR, settings.MODEL_WATCH_INTERVAL_S)
     yield
+    model_reloader.stop()
+    if micro_batcher is not None:
+        micro_batcher.shutdown()
+    inference_executor.shutdown(wait=False)
 
 
 app = FastAPI(title="Ticket Router", lifespan=lifespan)
@@ -49,7 +97,7 @@ async def request_logging_middleware(request: Request, call_next):
     start = time.perf_counter()
     status_code = 500
     try:
-        if request.method == "POST" and request.url.path in {"/predict", "/predict_batch"}:
+        if request.method == "POST" and _is_predict_path(request.url.path):
             max_bytes = settings.MAX_BODY_BYTES
             content_length = request.headers.get("content-length")
             if content_length:
@@ -95,6 +143,7 @@ def health() -> HealthResponse:
         model_loaded=predictor.loaded,
         model_dir=predictor.model_dir,
         model_version=predictor.model_version,
+        pending_model_version=model_reloader.status()["pending_model_version"],
     )
 
 
@@ -115,8 +164,17 @@ def health() -> HealthResponse:
                                 "model_loaded": False,
                                 "model_dir": None,
                                 "model_version": None,
+                                "pending_model_version": None,
+                                "reload": None,
                                 "max_body_bytes": 262144,
                                 "predict_timeout_ms": 1500,
+                                "inference_backend": None,
+                                "inference_workers": 2,
+                                "inference_queue_size": 32,
+                                "inference_in_flight": 0,
+                                "inference_queue_depth": 0,
+                                "batching": None,
+                                "prediction_cache": None,
                             },
                         }
                     }
@@ -132,28 +190,246 @@ def ready() -> JSONResponse:
     if settings.MODEL_DIR and not model_loaded:
         ready_state = False
         status_code = 503
+    reload_status = model_reloader.status()
     payload = {
         "status": "ok",
         "ready": ready_state,
         "model_loaded": model_loaded,
         "model_dir": predictor.model_dir,
         "model_version": predictor.model_version,
+        "pending_model_version": reload_status["pending_model_version"],
+        "reload": reload_status,
         "max_body_bytes": settings.MAX_BODY_BYTES,
         "predict_timeout_ms": settings.PREDICT_TIMEOUT_MS,
+        "inference_backend": predictor.backend,
+        "inference_workers": inference_executor.max_workers,
+        "inference_queue_size": inference_executor.max_queue,
+        "inference_in_flight": inference_executor.in_flight,
+        "inference_queue_depth": inference_executor.queue_depth,
+        "batching": micro_batcher.stats() if micro_batcher is not None else None,
+        "prediction_cache": predictor.cache.stats() if predictor.cache is not None else None,
     }
     return JSONResponse(content=payload, status_code=status_code)
 
 
+@app.post("/admin/reload", response_model=ReloadResponse, status_code=202)
+def admin_reload(
+    http_request: Request,
+    request: Optional[ReloadRequest] = None,
+    x_admin_token: Optional[str] = Header(default=None),
+) -> ReloadResponse:
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+    model_dir = (request.model_dir if request else None) or settings.MODEL_DIR
+    if not model_dir:
+        raise HTTPException(status_code=400, detail="model_dir is required when MODEL_DIR is unset")
+    try:
+        model_reloader.start(model_dir)
+    except ReloadInProgressError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    _log_event(
+        "model_reload_requested",
+        request_id=http_request.state.request_id,
+        model_version=predictor.model_version,
+        model_dir=predictor.model_dir,
+        pending_model_dir=model_dir,
+    )
+    return ReloadResponse(
+        status="accepted",
+        model_dir=model_dir,
+        model_version=predictor.model_version,
+        reload=model_reloader.status(),
+    )
+
+
+@app.get("/models")
+def list_models() -> JSONResponse:
+    if model_registry is None:
+        raise HTTPException(status_code=404, detail="Model registry is not configured")
+    return JSONResponse(content=model_registry.stats())
+
+
 @app.post("/predict", response_model=PredictResponse)
-def predict(http_request: Request, request: PredictRequest) -> PredictResponse:
-    if not predictor.loaded:
+def predict(
+    http_request: Request,
+    request: PredictRequest,
+    x_model_name: Optional[str] = Header(default=None),
+) -> PredictResponse:
+    return _predict_single(http_request, request, x_model_name, path="/predict")
+
+
+@app.post("/models/{model_name}/predict", response_model=PredictResponse)
+def predict_named(
+    model_name: str, http_request: Request, request: PredictRequest
+) -> PredictResponse:
+    return _predict_single(http_request, request, model_name, path="/models/{model_name}/predict")
+
+
+@app.post(
+    "/predict_batch",
+    response_model=PredictBatchResponse,
+    response_model_exclude_none=True,
+)
+def predict_batch(
+    http_request: Request,
+    request: PredictBatchRequest,
+    x_model_name: Optional[str] = Header(default=None),
+) -> PredictBatchResponse:
+    return _predict_many(http_request, request, x_model_name, path="/predict_batch")
+
+
+@app.post(
+    "/models/{model_name}/predict_batch",
+    response_model=PredictBatchResponse,
+    response_model_exclude_none=True,
+)
+def predict_batch_named(
+    model_name: str, http_request: Request, request: PredictBatchRequest
+) -> PredictBatchResponse:
+    return _predict_many(
+        http_request, request, model_name, path="/models/{model_name}/predict_batch"
+    )
+
+
+@app.post(
+    "/predict_stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def predict_stream(
+    http_request: Request,
+    top_k: int = Query(default=3, ge=1, le=10),
+    min_confidence: float = Query(default=0.55, ge=0.0, le=1.0),
+    x_model_name: Optional[str] = Header(default=None),
+) -> StreamingResponse:
+    target = await run_in_threadpool(_resolve_predictor, x_model_name)
+    if not target.loaded:
+        raise HTTPException(status_code=503, detail="Model not loaded")
+    lines = _stream_predictions(
+        http_request,
+        target=target,
+        top_k=top_k,
+        min_confidence=min_confidence,
+        request_id=http_request.state.request_id,
+    )
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+async def _stream_predictions(
+    http_request: Request,
+    target: Predictor,
+    top_k: int,
+    min_confidence: float,
+    request_id: str,
+) -> AsyncIterator[bytes]:
+    """Score NDJSON ``{id, text}`` lines in fixed-size chunks, yielding results per chunk.
+
+    The request body is only read further once the previous chunk's results have been
+    handed to the transport, so memory stays bounded by the chunk size.
+    """
+    chunk_size = max(1, settings.STREAM_CHUNK_SIZE)
+    max_line_bytes = settings.MAX_BODY_BYTES
+    pending: list[PredictBatchItem] = []
+    counts = {"items": 0, "needs_human": 0, "errors": 0, "chunks": 0}
+    buffer = b""
+    line_number = 0
+
+    async def flush() -> bytes:
+        items = list(pending)
+        pending.clear()
+        results = await run_in_threadpool(
+            _predict_with_timeout,
+            [item.text for item in items],
+            top_k=top_k,
+            min_confidence=min_confidence,
+            request_id=request_id,
+            path="/predict_stream",
+            target=target,
+        )
+        counts["chunks"] += 1
+        counts["items"] += len(results)
+        counts["needs_human"] += sum(1 for result in results if result["needs_human"])
+        return b"".join(
+            _ndjson(
+                {
+                    "id": item.id,
+                    "label": result["label"],
+                    "confidence": result["confidence"],
+                    "needs_human": result["needs_human"],
+                }
+            )
+            for item, result in zip(items, results)
+        )
+
+    def parse(raw: bytes) -> Optional[bytes]:
+        if not raw.strip():
+            return None
+        try:
+            pending.append(PredictBatchItem.model_validate_json(raw))
+        except ValidationError as exc:
+            counts["errors"] += 1
+            return _ndjson({"line": line_number, "error": exc.errors()[0]["msg"]})
+        return None
+
+    try:
+        async for body_chunk in http_request.stream():
+            buffer += body_chunk
+            *complete, buffer = buffer.split(b"\n")
+            for raw in complete:
+                line_number += 1
+                error = parse(raw)
+                if error is not None:
+                    yield error
+                if len(pending) >= chunk_size:
+                    yield await flush()
+            if len(buffer) > max_line_bytes:
+                counts["errors"] += 1
+                yield _ndjson({"line": line_number + 1, "error": "Line too long"})
+                return
+        if buffer:
+            line_number += 1
+            error = parse(buffer)
+            if error is not None:
+                yield error
+        if pending:
+            yield await flush()
+    except HTTPException as exc:
+        counts["errors"] += 1
+        yield _ndjson({"error": exc.detail})
+    finally:
+        _log_event(
+            "prediction_stream",
+            request_id=request_id,
+            model_version=target.model_version,
+            model_dir=target.model_dir,
+            min_confidence=min_confidence,
+            top_k=top_k,
+            item_count=counts["items"],
+            needs_human_count=counts["needs_human"],
+            error_count=counts["errors"],
+            chunk_count=counts["chunks"],
+        )
+
+
+def _ndjson(payload: dict[str, object]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _predict_single(
+    http_request: Request, request: PredictRequest, model_name: Optional[str], path: str
+) -> PredictResponse:
+    target = _resolve_predictor(model_name)
+    if not target.loaded:
         raise HTTPException(status_code=503, detail="Model not loaded")
     result = _predict_with_timeout(
         [request.text],
         top_k=request.top_k,
         min_confidence=request.min_confidence,
         request_id=http_request.state.request_id,
-        path="/predict",
+        path=path,
+        target=target,
     )[0]
     _log_prediction(
         request_id=http_request.state.request_id,
@@ -162,17 +438,16 @@ def predict(http_request: Request, request: PredictRequest) -> PredictResponse:
         label=result["label"],
         confidence=result["confidence"],
         needs_human=result["needs_human"],
+        target=target,
     )
     return PredictResponse(**result)
 
 
-@app.post(
-    "/predict_batch",
-    response_model=PredictBatchResponse,
-    response_model_exclude_none=True,
-)
-def predict_batch(http_request: Request, request: PredictBatchRequest) -> PredictBatchResponse:
-    if not predictor.loaded:
+def _predict_many(
+    http_request: Request, request: PredictBatchRequest, model_name: Optional[str], path: str
+) -> PredictBatchResponse:
+    target = _resolve_predictor(model_name)
+    if not target.loaded:
         raise HTTPException(status_code=503, detail="Model not loaded")
     texts = [item.text for item in request.items]
     results = _predict_with_timeout(
@@ -180,7 +455,8 @@ def predict_batch(http_request: Request, request: PredictBatchRequest) -> Predic
         top_k=request.top_k,
         min_confidence=request.min_confidence,
         request_id=http_request.state.request_id,
-        path="/predict_batch",
+        path=path,
+        target=target,
     )
     needs_human_count = sum(1 for result in results if result["needs_human"])
     _log_prediction_batch(
@@ -189,6 +465,7 @@ def predict_batch(http_request: Request, request: PredictBatchRequest) -> Predic
         top_k=request.top_k,
         item_count=len(results),
         needs_human_count=needs_human_count,
+        target=target,
     )
     items = [
         {
@@ -199,7 +476,27 @@ def predict_batch(http_request: Request, request: PredictBatchRequest) -> Predic
         }
         for item, result in zip(request.items, results)
     ]
-    return PredictBatchResponse(items=items, model_version=predictor.model_version)
+    return PredictBatchResponse(items=items, model_version=target.model_version)
+
+
+def _resolve_predictor(model_name: Optional[str]) -> Predictor:
+    if model_name is None:
+        return predictor
+    if model_registry is None:
+        raise HTTPException(status_code=404, detail="Model registry is not configured")
+    try:
+        return model_registry.get(model_name)
+    except ModelNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.exception("Failed to load model %s from registry", model_name)
+        raise HTTPException(status_code=503, detail="Model failed to load") from exc
+
+
+def _is_predict_path(path: str) -> bool:
+    if path in {"/predict", "/predict_batch"}:
+        return True
+    return path.startswith("/models/") and path.endswith(("/predict", "/predict_batch"))
 
 
 def _log_prediction(
@@ -209,12 +506,13 @@ def _log_prediction(
     label: str,
     confidence: float,
     needs_human: bool,
+    target: Predictor,
 ) -> None:
     _log_event(
         "prediction",
         request_id=request_id,
-        model_version=predictor.model_version,
-        model_dir=predictor.model_dir,
+        model_version=target.model_version,
+        model_dir=target.model_dir,
         min_confidence=min_confidence,
         top_k=top_k,
         label=label,
@@ -229,12 +527,13 @@ def _log_prediction_batch(
     top_k: int,
     item_count: int,
     needs_human_count: int,
+    target: Predictor,
 ) -> None:
     _log_event(
         "prediction_batch",
         request_id=request_id,
-        model_version=predictor.model_version,
-        model_dir=predictor.model_dir,
+        model_version=target.model_version,
+        model_dir=target.model_dir,
         min_confidence=min_confidence,
         top_k=top_k,
         item_count=item_count,
@@ -257,25 +556,44 @@ def _predict_with_timeout(
     min_confidence: float,
     request_id: str,
     path: str,
+    target: Predictor,
 ) -> list[dict[str, object]]:
     timeout_ms = settings.PREDICT_TIMEOUT_MS
-    if timeout_ms <= 0:
-        return predictor.predict(texts, top_k=top_k, min_confidence=min_confidence)
-    timeout_seconds = timeout_ms / 1000
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(
-            predictor.predict, texts, top_k=top_k, min_confidence=min_confidence
-        )
-        try:
-            return future.result(timeout=timeout_seconds)
-        except TimeoutError as exc:
-            future.cancel()
-            _log_event(
-                "prediction_timeout",
-                request_id=request_id,
-                path=path,
-                timeout_ms=timeout_ms,
-                model_version=predictor.model_version,
-                model_dir=predictor.model_dir,
+    batched = micro_batcher is not None and target is predictor and len(texts) == 1
+    try:
+        if batched:
+            future = micro_batcher.submit(texts[0], top_k=top_k, min_confidence=min_confidence)
+        else:
+            future = inference_executor.submit(
+                target.predict, texts, top_k=top_k, min_confidence=min_confidence
             )
-            raise HTTPException(status_code=503, detail="Prediction timed out") from exc
+    except QueueFullError as exc:
+        _log_event(
+            "prediction_rejected",
+            request_id=request_id,
+            path=path,
+            queue_depth=inference_executor.queue_depth,
+            in_flight=inference_executor.in_flight,
+            model_version=target.model_version,
+            model_dir=target.model_dir,
+        )
+        raise HTTPException(
+            status_code=503,
+            detail="Inference queue is full",
+            headers={"Retry-After": str(settings.RETRY_AFTER_SECONDS)},
+        ) from exc
+    timeout_seconds = timeout_ms / 1000 if timeout_ms > 0 else None
+    try:
+        result = future.result(timeout=timeout_seconds)
+    except TimeoutError as exc:
+        future.cancel()
+        _log_event(
+            "prediction_timeout",
+            request_id=request_id,
+            path=path,
+            timeout_ms=timeout_ms,
+            model_version=target.model_version,
+            model_dir=target.model_dir,
+        )
+        raise HTTPException(status_code=503, detail="Prediction timed out") from exc
+    return [result] if batched else result
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -127,6 +127,7 @@ class HealthResponse(BaseModel):
     model_loaded: bool
     model_dir: Optional[str] = None
     model_version: Optional[str] = None
+    pending_model_version: Optional[str] = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -136,6 +137,7 @@ class HealthResponse(BaseModel):
                     "model_loaded": False,
                     "model_dir": None,
                     "model_version": None,
+                    "pending_model_version": None,
                 }
             ]
         }
@@ -148,8 +150,17 @@ class ReadyResponse(BaseModel):
     model_loaded: bool
     model_dir: Optional[str] = None
     model_version: Optional[str] = None
+    pending_model_version: Optional[str] = None
+    reload: Optional[Dict[str, object]] = None
     max_body_bytes: int
     predict_timeout_ms: int
+    inference_backend: Optional[str] = None
+    inference_workers: int
+    inference_queue_size: int
+    inference_in_flight: int
+    inference_queue_depth: int
+    batching: Optional[Dict[str, object]] = None
+    prediction_cache: Optional[Dict[str, object]] = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -160,8 +171,51 @@ class ReadyResponse(BaseModel):
                     "model_loaded": False,
                     "model_dir": None,
                     "model_version": None,
+                    "pending_model_version": None,
+                    "reload": None,
                     "max_body_bytes": 262144,
                     "predict_timeout_ms": 1500,
+                    "inference_backend": "compiled",
+                    "inference_workers": 2,
+                    "inference_queue_size": 32,
+                    "inference_in_flight": 0,
+                    "inference_queue_depth": 0,
+                    "batching": None,
+                    "prediction_cache": None,
+                }
+            ]
+        }
+    )
+
+
+class ReloadRequest(BaseModel):
+    model_dir: Optional[str] = None
+
+    model_config = ConfigDict(
+        json_schema_extra={"examples": [{"model_dir": "artifacts/model_0.2.0"}]}
+    )
+
+
+class ReloadResponse(BaseModel):
+    status: str
+    model_dir: str
+    model_version: Optional[str] = None
+    reload: Dict[str, object]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "status": "accepted",
+                    "model_dir": "artifacts/model_0.2.0",
+                    "model_version": "0.1.0",
+                    "reload": {
+                        "state": "loading",
+                        "pending_model_dir": "artifacts/model_0.2.0",
+                        "pending_model_version": None,
+                        "last_error": None,
+                        "last_reload_at": None,
+                    },
                 }
             ]
         }
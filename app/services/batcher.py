@@ -0,0 +1,126 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from app.core.metrics import LATENCY_BUCKETS_MS, SIZE_BUCKETS, Histogram
+from app.services.executor import QueueFullError
+from app.services.predictor import Predictor
+
+
+@dataclass
+class _PendingPrediction:
+    text: str
+    top_k: int
+    min_confidence: float
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    future: Future = field(default_factory=Future)
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-text predictions into one vectorized call."""
+
+    def __init__(
+        self,
+        predictor: Predictor,
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_pending: int,
+    ) -> None:
+        self.predictor = predictor
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self.max_pending = max(1, max_pending)
+        self.batch_size_histogram = Histogram(SIZE_BUCKETS)
+        self.wait_ms_histogram = Histogram(LATENCY_BUCKETS_MS)
+        self._queue: "queue.Queue[Optional[_PendingPrediction]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return self._pending
+
+    def submit(self, text: str, top_k: int, min_confidence: float) -> Future:
+        item = _PendingPrediction(text=text, top_k=top_k, min_confidence=min_confidence)
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise QueueFullError("Batch queue is full")
+            self._pending += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+                self._thread.start()
+        self._queue.put(item)
+        return item.future
+
+    def shutdown(self) -> None:
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout=5)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "pending": self.pending,
+            "batch_size": self.batch_size_histogram.snapshot(),
+            "wait_ms": self.wait_ms_histogram.snapshot(),
+        }
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.perf_counter() + self.max_wait_ms / 1000
+            stop = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+            if stop:
+                return
+
+    def _flush(self, batch: List[_PendingPrediction]) -> None:
+        with self._lock:
+            self._pending -= len(batch)
+        started = time.perf_counter()
+        live = [item for item in batch if item.future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        self.batch_size_histogram.observe(len(live))
+        for item in live:
+            self.wait_ms_histogram.observe((started - item.enqueued_at) * 1000)
+        groups: Dict[Tuple[int, float], List[_PendingPrediction]] = {}
+        for item in live:
+            groups.setdefault((item.top_k, item.min_confidence), []).append(item)
+        for (top_k, min_confidence), items in groups.items():
+            try:
+                results = self.predictor.predict(
+                    [item.text for item in items], top_k=top_k, min_confidence=min_confidence
+                )
+            except Exception as exc:
+                for item in items:
+                    item.future.set_exception(exc)
+                continue
+            for item, result in zip(items, results):
+                item.future.set_result(result)
@@ -0,0 +1,282 @@
+import json
+import re
+import sys
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+ENGINE_DIR = "engine"
+ENGINE_MANIFEST_FILE = "manifest.json"
+ENGINE_FORMAT = "tfidf-linear"
+ENGINE_FORMAT_VERSION = 1
+
+
+class MappedVocabulary:
+    """Read-only term -> column lookup over sorted UTF-8 terms and a CRC32 hash index.
+
+    Every array may be a read-only memory map, so workers that open the same
+    artifact share the physical pages instead of each building a private dict.
+    """
+
+    def __init__(self, vocab_bytes: np.ndarray, offsets: np.ndarray, index: np.ndarray) -> None:
+        self._arrays = (vocab_bytes, offsets, index)
+        self._bytes = memoryview(vocab_bytes).cast("B")
+        self._offsets = memoryview(offsets).cast("B").cast("q")
+        self._index = memoryview(index).cast("B").cast("i")
+        self._mask = len(index) - 1
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self._arrays)
+
+    def get(self, term: str) -> Optional[int]:
+        encoded = term.encode("utf-8")
+        slot = zlib.crc32(encoded) & self._mask
+        while True:
+            column = self._index[slot]
+            if column < 0:
+                return None
+            if self._bytes[self._offsets[column] : self._offsets[column + 1]] == encoded:
+                return column
+            slot = (slot + 1) & self._mask
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        for column in range(len(self)):
+            start, end = self._offsets[column], self._offsets[column + 1]
+            yield bytes(self._bytes[start:end]).decode("utf-8"), column
+
+
+@dataclass
+class LinearEngine:
+    """TF-IDF + linear classifier scored with plain NumPy/SciPy."""
+
+    vocabulary: Union[Dict[str, int], MappedVocabulary]
+    idf: Optional[np.ndarray]
+    coef: np.ndarray
+    intercept: np.ndarray
+    token_pattern: str
+    ngram_range: Tuple[int, int]
+    lowercase: bool
+    stop_words: FrozenSet[str]
+    sublinear_tf: bool
+    norm: Optional[str]
+    ovr: bool
+
+    def __post_init__(self) -> None:
+        self._token_re = re.compile(self.token_pattern)
+
+    @property
+    def num_features(self) -> int:
+        return self.coef.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self.coef, self.intercept] + ([self.idf] if self.idf is not None else [])
+        size = sum(array.nbytes for array in arrays)
+        if isinstance(self.vocabulary, MappedVocabulary):
+            return size + self.vocabulary.nbytes
+        return size + sum(sys.getsizeof(term) + 100 for term in self.vocabulary)
+
+    def transform(self, texts: List[str]) -> sparse.csr_matrix:
+        vocabulary = self.vocabulary
+        indptr = [0]
+        indices: List[int] = []
+        values: List[float] = []
+        for text in texts:
+            counts: Dict[int, int] = {}
+            for term in self._analyze(text):
+                column = vocabulary.get(term)
+                if column is not None:
+                    counts[column] = counts.get(column, 0) + 1
+            indices.extend(counts.keys())
+            values.extend(counts.values())
+            indptr.append(len(indices))
+        data = np.asarray(values, dtype=np.float32)
+        columns = np.asarray(indices, dtype=np.int32)
+        row_ptr = np.asarray(indptr, dtype=np.int32)
+        if self.sublinear_tf:
+            np.log(data, out=data)
+            data += 1
+        if self.idf is not None:
+            data *= self.idf[columns]
+        if self.norm in ("l1", "l2"):
+            rows = np.repeat(np.arange(len(texts)), np.diff(row_ptr))
+            weights = data * data if self.norm == "l2" else np.abs(data)
+            row_norms = np.bincount(rows, weights=weights, minlength=len(texts))
+            if self.norm == "l2":
+                row_norms = np.sqrt(row_norms)
+            row_norms[row_norms == 0] = 1
+            data /= row_norms[rows].astype(np.float32)
+        return sparse.csr_matrix((data, columns, row_ptr), shape=(len(texts), self.num_features))
+
+    def decision_function(self, matrix: sparse.csr_matrix) -> np.ndarray:
+        return np.asarray(matrix @ self.coef) + self.intercept
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        scores = self.decision_function(self.transform(texts)).astype(np.float64)
+        if scores.shape[1] == 1:
+            positive = _sigmoid(scores[:, 0])
+            return np.column_stack([1 - positive, positive])
+        if self.ovr:
+            probabilities = _sigmoid(scores)
+            probabilities /= probabilities.sum(axis=1, keepdims=True)
+            return probabilities
+        scores -= scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    def save(self, model_dir: Path) -> None:
+        """Write the pickle-free, memory-mappable layout under ``model_dir/engine``."""
+        engine_dir = model_dir / ENGINE_DIR
+        engine_dir.mkdir(parents=True, exist_ok=True)
+        terms = sorted(self.vocabulary.items(), key=lambda item: item[0])
+        order = np.fromiter((column for _, column in terms), dtype=np.int64, count=len(terms))
+        encoded = [term.encode("utf-8") for term, _ in terms]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(term) for term in encoded], out=offsets[1:])
+        arrays = {
+            "vocab_bytes": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            "vocab_offsets": offsets,
+            "vocab_index": _build_hash_index(encoded),
+            "coef": np.ascontiguousarray(self.coef[order], dtype=np.float32),
+            "intercept": np.asarray(self.intercept, dtype=np.float32),
+        }
+        if self.idf is not None:
+            arrays["idf"] = np.asarray(self.idf[order], dtype=np.float32)
+        for name, array in arrays.items():
+            np.save(engine_dir / f"{name}.npy", array, allow_pickle=False)
+        manifest = {
+            "format": ENGINE_FORMAT,
+            "format_version": ENGINE_FORMAT_VERSION,
+            "num_features": len(encoded),
+            "num_classes": int(self.coef.shape[1]),
+            "arrays": sorted(arrays),
+            "config": {
+                "token_pattern": self.token_pattern,
+                "ngram_range": list(self.ngram_range),
+                "lowercase": self.lowercase,
+                "stop_words": sorted(self.stop_words),
+                "sublinear_tf": self.sublinear_tf,
+                "norm": self.norm,
+                "ovr": self.ovr,
+            },
+        }
+        with (engine_dir / ENGINE_MANIFEST_FILE).open("w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2)
+
+    @classmethod
+    def load(cls, model_dir: Path, mmap: bool = True) -> "LinearEngine":
+        engine_dir = model_dir / ENGINE_DIR
+        with (engine_dir / ENGINE_MANIFEST_FILE).open("r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        if manifest.get("format") != ENGINE_FORMAT:
+            raise ValueError(f"Unsupported engine format: {manifest.get('format')}")
+        if manifest.get("format_version") != ENGINE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported engine format version: {manifest.get('format_version')}")
+        mmap_mode = "r" if mmap else None
+        arrays = {
+            name: np.load(engine_dir / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+            for name in manifest["arrays"]
+        }
+        config = manifest["config"]
+        return cls(
+            vocabulary=MappedVocabulary(
+                arrays["vocab_bytes"], arrays["vocab_offsets"], arrays["vocab_index"]
+            ),
+            idf=arrays.get("idf"),
+            coef=arrays["coef"],
+            intercept=arrays["intercept"],
+            token_pattern=config["token_pattern"],
+            ngram_range=tuple(config["ngram_range"]),
+            lowercase=config["lowercase"],
+            stop_words=frozenset(config["stop_words"]),
+            sublinear_tf=config["sublinear_tf"],
+            norm=config["norm"],
+            ovr=config["ovr"],
+        )
+
+    def _analyze(self, text: str) -> List[str]:
+        if self.lowercase:
+            text = text.lower()
+        tokens = self._token_re.findall(text)
+        if self.stop_words:
+            tokens = [token for token in tokens if token not in self.stop_words]
+        min_n, max_n = self.ngram_range
+        if max_n == 1:
+            return tokens
+        terms = list(tokens) if min_n == 1 else []
+        count = len(tokens)
+        for n in range(max(min_n, 2), min(max_n, count) + 1):
+            for start in range(count - n + 1):
+                terms.append(" ".join(tokens[start : start + n]))
+        return terms
+
+
+def compile_engine(vectorizer: object, model: object) -> LinearEngine:
+    """Compile a fitted TfidfVectorizer + linear classifier pair into a LinearEngine."""
+    unsupported = [
+        name
+        for name, value in (
+            ("analyzer", getattr(vectorizer, "analyzer", "word") != "word"),
+            ("tokenizer", getattr(vectorizer, "tokenizer", None) is not None),
+            ("preprocessor", getattr(vectorizer, "preprocessor", None) is not None),
+            ("strip_accents", getattr(vectorizer, "strip_accents", None) is not None),
+            ("binary", getattr(vectorizer, "binary", False)),
+        )
+        if value
+    ]
+    if unsupported:
+        raise ValueError(f"Cannot compile vectorizer options: {', '.join(unsupported)}")
+    classes = np.asarray(model.classes_)
+    if not np.array_equal(classes, np.arange(len(classes))):
+        raise ValueError("Model classes must be contiguous label ids starting at 0")
+    stop_words = vectorizer.get_stop_words() or ()
+    idf = getattr(vectorizer, "idf_", None) if getattr(vectorizer, "use_idf", False) else None
+    return LinearEngine(
+        vocabulary={term: int(column) for term, column in vectorizer.vocabulary_.items()},
+        idf=None if idf is None else np.asarray(idf, dtype=np.float32),
+        coef=np.ascontiguousarray(model.coef_.T, dtype=np.float32),
+        intercept=np.asarray(model.intercept_, dtype=np.float32),
+        token_pattern=vectorizer.token_pattern,
+        ngram_range=tuple(vectorizer.ngram_range),
+        lowercase=bool(vectorizer.lowercase),
+        stop_words=frozenset(stop_words),
+        sublinear_tf=bool(getattr(vectorizer, "sublinear_tf", False)),
+        norm=getattr(vectorizer, "norm", None),
+        ovr=_uses_ovr(model),
+    )
+
+
+def _build_hash_index(encoded_terms: List[bytes]) -> np.ndarray:
+    size = 1
+    while size < 2 * max(1, len(encoded_terms)):
+        size *= 2
+    mask = size - 1
+    index = np.full(size, -1, dtype=np.int32)
+    slots = index.tolist()
+    for column, term in enumerate(encoded_terms):
+        slot = zlib.crc32(term) & mask
+        while slots[slot] >= 0:
+            slot = (slot + 1) & mask
+        slots[slot] = column
+    index[:] = slots
+    return index
+
+
+def _uses_ovr(model: object) -> bool:
+    multi_class = getattr(model, "multi_class", "auto")
+    if multi_class in ("auto", "deprecated"):
+        return getattr(model, "solver", "lbfgs") == "liblinear"
+    return multi_class == "ovr"
+
+
+def _sigmoid(values: np.ndarray) -> np.ndarray:
+    return 1 / (1 + np.exp(-values))
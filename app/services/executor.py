@@ -0,0 +1,70 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+
+class QueueFullError(RuntimeError):
+    pass
+
+
+class InferenceExecutor:
+    """Process-wide inference pool with bounded admission."""
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._in_flight = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        with self._lock:
+            return self._pending - self._in_flight
+
+    def submit(self, fn: Callable[..., object], *args: object, **kwargs: object) -> Future:
+        with self._lock:
+            if self._pending >= self.capacity:
+                raise QueueFullError("Inference queue is full")
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="inference"
+                )
+            self._pending += 1
+            try:
+                future = self._pool.submit(self._run, fn, args, kwargs)
+            except Exception:
+                self._pending -= 1
+                raise
+        future.add_done_callback(self._release)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pool = self._pool
+            self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, fn: Callable[..., object], args: tuple, kwargs: dict) -> object:
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
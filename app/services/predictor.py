@@ -1,76 +1,278 @@
+import itertools
 import json
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import joblib
 import numpy as np
 
+from app.services.engine import ENGINE_DIR, ENGINE_MANIFEST_FILE, LinearEngine, compile_engine
+
+BACKENDS = ("auto", "sklearn", "compiled")
+
 
 @dataclass
 class ModelBundle:
-    model: object
-    vectorizer: object
+    model: Optional[object]
+    vectorizer: Optional[object]
     label_map: Dict[int, str]
+    labels: np.ndarray
+    engine: Optional[LinearEngine] = None
+    model_dir: Optional[str] = None
+    model_version: Optional[str] = None
+    generation: int = 0
+
+    @property
+    def backend(self) -> str:
+        return "compiled" if self.engine is not None else "sklearn"
+
+    @property
+    def lowercase(self) -> bool:
+        source = self.engine if self.engine is not None else self.vectorizer
+        return bool(getattr(source, "lowercase", False))
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        if self.engine is not None:
+            return self.engine.predict_proba(texts)
+        return self.model.predict_proba(self.vectorizer.transform(texts))
+
+
+CACHE_TOP_K = 10
+CACHE_ENTRY_OVERHEAD_BYTES = 200
+
+CacheKey = Tuple[Optional[str], str]
+
+
+class PredictionCache:
+    """Byte-bounded LRU of top-k candidates keyed on (model namespace, normalized text)."""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float = 0.0) -> None:
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[np.ndarray, np.ndarray, float, int]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            indices, scores, stored_at, size = entry
+            if self.ttl_seconds > 0 and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._bytes -= size
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return indices, scores
+
+    def put(self, key: CacheKey, indices: np.ndarray, scores: np.ndarray) -> None:
+        size = len(key[1]) + indices.nbytes + scores.nbytes + CACHE_ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[3]
+            self._entries[key] = (indices, scores, time.monotonic(), size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[3]
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
 
 
 class Predictor:
-    def __init__(self) -> None:
+    def __init__(self, cache: Optional[PredictionCache] = None, backend: str = "auto") -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown inference backend: {backend}")
+        self.requested_backend = backend
         self._bundle: Optional[ModelBundle] = None
-        self.model_dir: Optional[str] = None
-        self.model_version: Optional[str] = None
+        self._generation = itertools.count(1)
+        self.cache = cache
 
     @property
     def loaded(self) -> bool:
         return self._bundle is not None
 
+    @property
+    def bundle(self) -> Optional[ModelBundle]:
+        return self._bundle
+
+    @property
+    def backend(self) -> Optional[str]:
+        bundle = self._bundle
+        return bundle.backend if bundle is not None else None
+
+    @property
+    def model_dir(self) -> Optional[str]:
+        bundle = self._bundle
+        return bundle.model_dir if bundle is not None else None
+
+    @property
+    def model_version(self) -> Optional[str]:
+        bundle = self._bundle
+        return bundle.model_version if bundle is not None else None
+
     def load(self, model_dir: str) -> None:
+        self.swap(self.load_bundle(model_dir))
+
+    def load_bundle(self, model_dir: str) -> ModelBundle:
+        """Read a model directory into a new bundle without touching the served one."""
         model_path = Path(model_dir)
-        model = joblib.load(model_path / "model.pkl")
-        vectorizer = joblib.load(model_path / "vectorizer.pkl")
+        model, vectorizer, engine = self._load_scorer(model_path)
         with (model_path / "label_map.json").open("r", encoding="utf-8") as handle:
             raw_map = json.load(handle)
         label_map = {int(key): value for key, value in raw_map.items()}
         metadata_path = model_path / "metadata.json"
+        model_version = None
         if metadata_path.exists():
             with metadata_path.open("r", encoding="utf-8") as handle:
                 metadata = json.load(handle)
-            self.model_version = metadata.get("model_version")
-        self._bundle = ModelBundle(model=model, vectorizer=vectorizer, label_map=label_map)
-        self.model_dir = str(model_path)
+            model_version = metadata.get("model_version")
+        labels = np.array([label_map[idx] for idx in sorted(label_map)], dtype=object)
+        return ModelBundle(
+            model=model,
+            vectorizer=vectorizer,
+            label_map=label_map,
+            labels=labels,
+            engine=engine,
+            model_dir=str(model_path),
+            model_version=model_version,
+            generation=next(self._generation),
+        )
+
+    def swap(self, bundle: ModelBundle) -> Optional[ModelBundle]:
+        """Atomically serve ``bundle``; requests already running keep the old one."""
+        previous, self._bundle = self._bundle, bundle
+        if self.cache is not None:
+            self.cache.clear()
+        return previous
 
     def predict(
-        self, texts: List[str], top_k: int = 3, min_confidence: float = 0.55
+        self,
+        texts: List[str],
+        top_k: int = 3,
+        min_confidence: float = 0.55,
+        bundle: Optional[ModelBundle] = None,
     ) -> List[Dict[str, object]]:
-        if not self._bundle:
+        bundle = bundle if bundle is not None else self._bundle
+        if not bundle:
             raise RuntimeError("Model not loaded")
-        vectorizer = self._bundle.vectorizer
-        model = self._bundle.model
-        label_map = self._bundle.label_map
-        matrix = vectorizer.transform(texts)
-        probabilities = model.predict_proba(matrix)
-        num_classes = probabilities.shape[1]
+        num_classes = len(bundle.labels)
         k = min(top_k, num_classes)
-        results: List[Dict[str, object]] = []
-        for row in probabilities:
-            top_indices = np.argsort(row)[::-1][:k]
-            alternatives = [
-                {
-                    "label": label_map[int(idx)],
-                    "confidence": float(row[int(idx)]),
-                }
-                for idx in top_indices
-            ]
-            top_label = alternatives[0]["label"]
-            top_confidence = alternatives[0]["confidence"]
-            needs_human = top_confidence < min_confidence
-            label = "human_review" if needs_human else top_label
-            results.append(
-                {
-                    "label": label,
-                    "confidence": top_confidence,
-                    "alternatives": alternatives,
-                    "needs_human": needs_human,
-                }
+        if self.cache is not None and k <= CACHE_TOP_K:
+            top_indices, top_scores = self._cached_top_k(
+                bundle, texts, min(CACHE_TOP_K, num_classes)
             )
-        return results
+            top_indices, top_scores = top_indices[:, :k], top_scores[:, :k]
+        else:
+            top_indices, top_scores = select_top_k(bundle.predict_proba(texts), k)
+        needs_human = top_scores[:, 0] < min_confidence
+        top_labels = bundle.labels[top_indices]
+        return build_results(top_labels, top_scores, needs_human)
+
+    def _load_scorer(
+        self, model_path: Path
+    ) -> Tuple[Optional[object], Optional[object], Optional[LinearEngine]]:
+        has_engine = (model_path / ENGINE_DIR / ENGINE_MANIFEST_FILE).exists()
+        if self.requested_backend != "sklearn" and has_engine:
+            return None, None, LinearEngine.load(model_path)
+        model = joblib.load(model_path / "model.pkl")
+        vectorizer = joblib.load(model_path / "vectorizer.pkl")
+        if self.requested_backend == "compiled":
+            return None, None, compile_engine(vectorizer, model)
+        return model, vectorizer, None
+
+    def _cached_top_k(
+        self, bundle: ModelBundle, texts: List[str], width: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        namespace = f"{bundle.model_version}#{bundle.generation}"
+        keys = [(namespace, _normalize_text(text, bundle.lowercase)) for text in texts]
+        top_indices = np.empty((len(texts), width), dtype=np.intp)
+        top_scores = np.empty((len(texts), width), dtype=np.float64)
+        miss_rows: Dict[CacheKey, List[int]] = {}
+        for row, key in enumerate(keys):
+            cached = self.cache.get(key)
+            if cached is None:
+                miss_rows.setdefault(key, []).append(row)
+            else:
+                top_indices[row], top_scores[row] = cached
+        if miss_rows:
+            miss_keys = list(miss_rows)
+            miss_texts = [texts[miss_rows[key][0]] for key in miss_keys]
+            indices, scores = select_top_k(bundle.predict_proba(miss_texts), width)
+            for key, row_indices, row_scores in zip(miss_keys, indices, scores):
+                self.cache.put(key, row_indices.copy(), row_scores.copy())
+                top_indices[miss_rows[key]] = row_indices
+                top_scores[miss_rows[key]] = row_scores
+        return top_indices, top_scores
+
+
+def _normalize_text(text: str, lowercase: bool) -> str:
+    normalized = " ".join(text.split())
+    return normalized.lower() if lowercase else normalized
+
+
+def select_top_k(probabilities: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Indices and scores of the k largest columns per row, highest first."""
+    num_rows, num_classes = probabilities.shape
+    if k < num_classes:
+        candidates = np.argpartition(probabilities, num_classes - k, axis=1)[:, num_classes - k :]
+    else:
+        candidates = np.broadcast_to(np.arange(num_classes), probabilities.shape)
+    rows = np.arange(num_rows)[:, None]
+    candidate_scores = probabilities[rows, candidates]
+    order = np.argsort(candidate_scores, axis=1)[:, ::-1]
+    return candidates[rows, order], candidate_scores[rows, order]
+
+
+def build_results(
+    top_labels: np.ndarray, top_scores: np.ndarray, needs_human: np.ndarray
+) -> List[Dict[str, object]]:
+    labels_rows = top_labels.tolist()
+    scores_rows = top_scores.tolist()
+    flags = needs_human.tolist()
+    results: List[Dict[str, object]] = []
+    for row_labels, row_scores, flag in zip(labels_rows, scores_rows, flags):
+        results.append(
+            {
+                "label": "human_review" if flag else row_labels[0],
+                "confidence": row_scores[0],
+                "alternatives": [
+                    {"label": label, "confidence": score}
+                    for label, score in zip(row_labels, row_scores)
+                ],
+                "needs_human": flag,
+            }
+        )
+    return results
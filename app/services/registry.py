@@ -0,0 +1,164 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.services.predictor import ModelBundle, Predictor
+
+MODEL_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+class ModelNotFoundError(LookupError):
+    pass
+
+
+@dataclass
+class _RegistryEntry:
+    predictor: Predictor
+    size_bytes: int
+    load_ms: float
+    loaded_at: float
+    last_used: float
+    hits: int = 0
+
+
+class ModelRegistry:
+    """Serve many model directories from one process, loaded lazily under a memory budget."""
+
+    def __init__(self, root_dir: str, max_bytes: int, backend: str = "auto") -> None:
+        self.root_dir = Path(root_dir)
+        self.max_bytes = max_bytes
+        self.backend = backend
+        self.loads = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, _RegistryEntry]" = OrderedDict()
+        self._load_stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    @property
+    def used_bytes(self) -> int:
+        with self._lock:
+            return sum(entry.size_bytes for entry in self._entries.values())
+
+    def available(self) -> List[str]:
+        if not self.root_dir.is_dir():
+            return []
+        return sorted(
+            path.name
+            for path in self.root_dir.iterdir()
+            if path.is_dir() and MODEL_NAME_PATTERN.match(path.name)
+        )
+
+    def get(self, name: str) -> Predictor:
+        entry = self._touch(name)
+        if entry is not None:
+            return entry.predictor
+        model_dir = self._resolve(name)
+        with self._lock:
+            load_lock = self._load_locks.setdefault(name, threading.Lock())
+        with load_lock:
+            entry = self._touch(name)
+            if entry is not None:
+                return entry.predictor
+            started = time.perf_counter()
+            predictor = Predictor(backend=self.backend)
+            predictor.load(str(model_dir))
+            load_ms = (time.perf_counter() - started) * 1000
+            now = time.monotonic()
+            entry = _RegistryEntry(
+                predictor=predictor,
+                size_bytes=estimate_bundle_bytes(predictor.bundle),
+                load_ms=load_ms,
+                loaded_at=now,
+                last_used=now,
+                hits=1,
+            )
+            with self._lock:
+                self._entries[name] = entry
+                self.loads += 1
+                stats = self._load_stats.setdefault(name, {"loads": 0, "total_load_ms": 0.0})
+                stats["loads"] += 1
+                stats["total_load_ms"] += load_ms
+                self._evict_locked(keep=name)
+        return predictor
+
+    def stats(self) -> Dict[str, object]:
+        now = time.monotonic()
+        with self._lock:
+            resident = {
+                name: {
+                    "resident": True,
+                    "size_bytes": entry.size_bytes,
+                    "load_ms": round(entry.load_ms, 2),
+                    "resident_seconds": round(now - entry.loaded_at, 1),
+                    "idle_seconds": round(now - entry.last_used, 1),
+                    "hits": entry.hits,
+                    "model_version": entry.predictor.model_version,
+                }
+                for name, entry in self._entries.items()
+            }
+            load_stats = {name: dict(stats) for name, stats in self._load_stats.items()}
+            used = sum(entry.size_bytes for entry in self._entries.values())
+        models = {}
+        for name in sorted(set(self.available()) | set(resident) | set(load_stats)):
+            model = resident.get(name, {"resident": False})
+            stats = load_stats.get(name)
+            if stats:
+                model["loads"] = int(stats["loads"])
+                model["avg_load_ms"] = round(stats["total_load_ms"] / stats["loads"], 2)
+            models[name] = model
+        return {
+            "max_bytes": self.max_bytes,
+            "used_bytes": used,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "models": models,
+        }
+
+    def _touch(self, name: str) -> Optional[_RegistryEntry]:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            self._entries.move_to_end(name)
+            entry.last_used = time.monotonic()
+            entry.hits += 1
+            return entry
+
+    def _resolve(self, name: str) -> Path:
+        if not MODEL_NAME_PATTERN.match(name):
+            raise ModelNotFoundError(f"Unknown model: {name}")
+        model_dir = self.root_dir / name
+        if not model_dir.is_dir():
+            raise ModelNotFoundError(f"Unknown model: {name}")
+        return model_dir
+
+    def _evict_locked(self, keep: str) -> None:
+        used = sum(entry.size_bytes for entry in self._entries.values())
+        for name in list(self._entries):
+            if used <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            used -= self._entries.pop(name).size_bytes
+            self.evictions += 1
+
+
+def estimate_bundle_bytes(bundle: Optional[ModelBundle]) -> int:
+    """Approximate resident size of a bundle; pickled models fall back to on-disk size."""
+    if bundle is None:
+        return 0
+    if bundle.engine is not None:
+        return bundle.engine.nbytes
+    model_dir = Path(bundle.model_dir) if bundle.model_dir else None
+    if model_dir is None:
+        return 0
+    return sum(
+        (model_dir / name).stat().st_size
+        for name in ("model.pkl", "vectorizer.pkl")
+        if (model_dir / name).exists()
+    )
@@ -0,0 +1,161 @@
+import logging
+import math
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.services.predictor import ModelBundle, Predictor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SMOKE_TEXTS = (
+    "Reset my password",
+    "Refund this charge",
+    "My card has not arrived yet",
+)
+
+
+class ReloadInProgressError(RuntimeError):
+    pass
+
+
+class ModelReloader:
+    """Load, warm, and validate a new bundle in the background, then swap it in."""
+
+    def __init__(
+        self, predictor: Predictor, smoke_texts: Sequence[str] = DEFAULT_SMOKE_TEXTS
+    ) -> None:
+        self.predictor = predictor
+        self.smoke_texts = list(smoke_texts) or list(DEFAULT_SMOKE_TEXTS)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._state = "idle"
+        self._pending_dir: Optional[str] = None
+        self._pending_version: Optional[str] = None
+        self._last_error: Optional[str] = None
+        self._last_reload_at: Optional[str] = None
+        self._watch_stop = threading.Event()
+        self._watch_thread: Optional[threading.Thread] = None
+
+    @property
+    def in_progress(self) -> bool:
+        with self._lock:
+            return self._thread is not None
+
+    def status(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "state": self._state,
+                "pending_model_dir": self._pending_dir,
+                "pending_model_version": self._pending_version,
+                "last_error": self._last_error,
+                "last_reload_at": self._last_reload_at,
+            }
+
+    def start(self, model_dir: str) -> None:
+        with self._lock:
+            if self._thread is not None:
+                raise ReloadInProgressError("A model reload is already in progress")
+            self._state = "loading"
+            self._pending_dir = model_dir
+            self._pending_version = None
+            self._last_error = None
+            self._thread = threading.Thread(
+                target=self._reload, args=(model_dir,), name="model-reload", daemon=True
+            )
+            self._thread.start()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def reload(self, model_dir: str) -> ModelBundle:
+        """Synchronously load, validate, and swap in ``model_dir``."""
+        bundle = self.predictor.load_bundle(model_dir)
+        with self._lock:
+            self._pending_version = bundle.model_version
+        self._validate(bundle)
+        self.predictor.swap(bundle)
+        return bundle
+
+    def watch(self, model_dir: str, interval_seconds: float) -> None:
+        """Poll ``model_dir`` (or the symlink it points through) and reload on change."""
+        if self._watch_thread is not None:
+            return
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop,
+            args=(model_dir, interval_seconds, _fingerprint(model_dir)),
+            name="model-watch",
+            daemon=True,
+        )
+        self._watch_thread.start()
+
+    def stop(self) -> None:
+        self._watch_stop.set()
+        thread, self._watch_thread = self._watch_thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+        self.join(timeout=5)
+
+    def _reload(self, model_dir: str) -> None:
+        try:
+            self.reload(model_dir)
+        except Exception as exc:
+            logger.exception("Model reload from %s failed", model_dir)
+            with self._lock:
+                self._state = "failed"
+                self._last_error = f"{type(exc).__name__}: {exc}"
+        else:
+            with self._lock:
+                self._state = "idle"
+                self._last_reload_at = datetime.now(timezone.utc).isoformat()
+        finally:
+            with self._lock:
+                self._pending_dir = None
+                self._pending_version = None
+                self._thread = None
+
+    def _validate(self, bundle: ModelBundle) -> None:
+        results = self.predictor.predict(
+            self.smoke_texts, top_k=len(bundle.labels), min_confidence=0.0, bundle=bundle
+        )
+        if len(results) != len(self.smoke_texts):
+            raise ValueError("Smoke prediction returned the wrong number of results")
+        for result in results:
+            confidences: List[float] = [alt["confidence"] for alt in result["alternatives"]]
+            if not all(math.isfinite(value) and 0.0 <= value <= 1.0 for value in confidences):
+                raise ValueError("Smoke prediction returned invalid confidences")
+            if not math.isclose(sum(confidences), 1.0, abs_tol=1e-3):
+                raise ValueError("Smoke prediction probabilities do not sum to 1")
+
+    def _watch_loop(self, model_dir: str, interval_seconds: float, last: Optional[tuple]) -> None:
+        while not self._watch_stop.wait(interval_seconds):
+            current = _fingerprint(model_dir)
+            if current is None or current == last or self.in_progress:
+                continue
+            last = current
+            try:
+                self.start(model_dir)
+            except ReloadInProgressError:
+                continue
+
+
+WATCHED_FILES = ("metadata.json", "label_map.json", "model.pkl", "engine/manifest.json")
+
+
+def _fingerprint(model_dir: str) -> Optional[Tuple[str, Tuple[Tuple[str, int], ...]]]:
+    resolved = Path(os.path.realpath(model_dir))
+    entries = []
+    for name in WATCHED_FILES:
+        try:
+            entries.append((name, (resolved / name).stat().st_mtime_ns))
+        except OSError:
+            continue
+    if not entries:
+        return None
+    return str(resolved), tuple(entries)
@@ -0,0 +1,68 @@
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from app.services.engine import compile_engine
+from benchmarks.bench_engine import NUM_TRAIN, _synthetic_corpus
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from app.services.predictor import Predictor
+predictor = Predictor(backend=sys.argv[2])
+predictor.load(sys.argv[1])
+load_s = time.perf_counter() - start
+predictor.predict(["w1 w2 w3 w40 w41"], top_k=3)
+status = {}
+with open("/proc/self/status", encoding="utf-8") as handle:
+    for line in handle:
+        key, _, value = line.partition(":")
+        if key in ("VmRSS", "RssAnon", "RssFile"):
+            status[key] = int(value.split()[0])
+print(json.dumps({"load_s": load_s, **status}))
+"""
+
+
+def _probe(model_dir: Path, backend: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE, str(model_dir), backend],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    texts, labels = _synthetic_corpus(rng, NUM_TRAIN)
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2))
+    model = LogisticRegression(max_iter=200).fit(vectorizer.fit_transform(texts), labels)
+    with tempfile.TemporaryDirectory() as tmp:
+        model_dir = Path(tmp)
+        joblib.dump(model, model_dir / "model.pkl")
+        joblib.dump(vectorizer, model_dir / "vectorizer.pkl")
+        compile_engine(vectorizer, model).save(model_dir)
+        label_map = {str(idx): f"intent_{idx}" for idx in range(len(model.classes_))}
+        (model_dir / "label_map.json").write_text(json.dumps(label_map), encoding="utf-8")
+
+        print(f"{'format':>10} {'load_ms':>9} {'rss_mb':>8} {'anon_mb':>8} {'file_mb':>8}")
+        for name, backend in (("pickle", "sklearn"), ("mmap", "auto")):
+            runs = [_probe(model_dir, backend) for _ in range(3)]
+            best = min(runs, key=lambda run: run["load_s"])
+            print(
+                f"{name:>10} {best['load_s'] * 1000:>9.1f} {best['VmRSS'] / 1024:>8.1f} "
+                f"{best['RssAnon'] / 1024:>8.1f} {best['RssFile'] / 1024:>8.1f}"
+            )
+    print("anon_mb is private per worker; file_mb pages are shared across workers.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from app.services.engine import compile_engine
+
+NUM_CLASSES = 77
+NUM_TRAIN = 10_000
+BATCH_SIZES = (1, 32, 1000)
+
+
+def _synthetic_corpus(rng: np.random.Generator, size: int) -> tuple[list[str], list[int]]:
+    words = [f"w{idx}" for idx in range(3000)]
+    labels = rng.integers(0, NUM_CLASSES, size=size)
+    texts = [
+        " ".join(rng.choice(words[label * 30 : label * 30 + 300], size=rng.integers(4, 20)))
+        for label in labels
+    ]
+    return texts, labels.tolist()
+
+
+def _best_of(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    texts, labels = _synthetic_corpus(rng, NUM_TRAIN)
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2))
+    model = LogisticRegression(max_iter=200).fit(vectorizer.fit_transform(texts), labels)
+    engine = compile_engine(vectorizer, model)
+
+    queries, _ = _synthetic_corpus(rng, max(BATCH_SIZES))
+    diff = np.abs(
+        engine.predict_proba(queries) - model.predict_proba(vectorizer.transform(queries))
+    )
+    print(f"max abs diff vs sklearn: {diff.max():.2e}")
+
+    print(f"{'batch':>8} {'sklearn_ms':>11} {'compiled_ms':>12} {'speedup':>8}")
+    for batch_size in BATCH_SIZES:
+        batch = queries[:batch_size]
+        repeats = 200 if batch_size < 100 else 10
+        sklearn_s = _best_of(lambda: model.predict_proba(vectorizer.transform(batch)), repeats)
+        compiled_s = _best_of(lambda: engine.predict_proba(batch), repeats)
+        print(
+            f"{batch_size:>8} {sklearn_s * 1000:>11.3f} {compiled_s * 1000:>12.3f} "
+            f"{sklearn_s / compiled_s:>7.1f}x"
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        joblib.dump((vectorizer, model), Path(tmp) / "sklearn.pkl")
+        engine.save(Path(tmp))
+        sizes = {path.name: path.stat().st_size for path in Path(tmp).iterdir()}
+    print(f"artifact bytes: {sizes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from app.services.predictor import build_results, select_top_k
+
+NUM_CLASSES = 77
+BATCH_SIZES = (1, 100, 10_000)
+TOP_K = 3
+MIN_CONFIDENCE = 0.55
+
+
+def loop_assembly(
+    probabilities: np.ndarray, label_map: Dict[int, str], k: int, min_confidence: float
+) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    for row in probabilities:
+        top_indices = np.argsort(row)[::-1][:k]
+        alternatives = [
+            {"label": label_map[int(idx)], "confidence": float(row[int(idx)])}
+            for idx in top_indices
+        ]
+        needs_human = alternatives[0]["confidence"] < min_confidence
+        results.append(
+            {
+                "label": "human_review" if needs_human else alternatives[0]["label"],
+                "confidence": alternatives[0]["confidence"],
+                "alternatives": alternatives,
+                "needs_human": needs_human,
+            }
+        )
+    return results
+
+
+def vectorized_assembly(
+    probabilities: np.ndarray, labels: np.ndarray, k: int, min_confidence: float
+) -> List[Dict[str, object]]:
+    top_indices, top_scores = select_top_k(probabilities, k)
+    return build_results(labels[top_indices], top_scores, top_scores[:, 0] < min_confidence)
+
+
+def _best_of(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    label_map = {idx: f"intent_{idx}" for idx in range(NUM_CLASSES)}
+    labels = np.array([label_map[idx] for idx in range(NUM_CLASSES)], dtype=object)
+    print(f"{'batch':>8} {'loop_ms':>10} {'vectorized_ms':>14} {'speedup':>8}")
+    for batch_size in BATCH_SIZES:
+        logits = rng.normal(size=(batch_size, NUM_CLASSES))
+        probabilities = np.exp(logits) / np.exp(logits).sum(axis=1, keepdims=True)
+        repeats = 200 if batch_size < 1000 else 5
+        loop_s = _best_of(
+            lambda: loop_assembly(probabilities, label_map, TOP_K, MIN_CONFIDENCE), repeats
+        )
+        vector_s = _best_of(
+            lambda: vectorized_assembly(probabilities, labels, TOP_K, MIN_CONFIDENCE), repeats
+        )
+        print(
+            f"{batch_size:>8} {loop_s * 1000:>10.3f} {vector_s * 1000:>14.3f} "
+            f"{loop_s / vector_s:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import importlib
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def test_ready_reports_inference_pool(monkeypatch: pytest.MonkeyPatch, model_dir) -> None:
+    monkeypatch.setenv("MODEL_DIR", str(model_dir))
+    monkeypatch.setenv("INFERENCE_WORKERS", "3")
+    monkeypatch.setenv("INFERENCE_QUEUE_SIZE", "5")
+    from app import main as main_module
+
+    importlib.reload(main_module)
+    with TestClient(main_module.app) as client:
+        body = client.get("/ready").json()
+        assert body["inference_workers"] == 3
+        assert body["inference_queue_size"] == 5
+        assert body["inference_in_flight"] == 0
+        assert body["inference_queue_depth"] == 0
+
+
+def test_predict_rejected_when_queue_full(monkeypatch: pytest.MonkeyPatch, model_dir) -> None:
+    monkeypatch.setenv("MODEL_DIR", str(model_dir))
+    monkeypatch.setenv("INFERENCE_WORKERS", "1")
+    monkeypatch.setenv("INFERENCE_QUEUE_SIZE", "0")
+    from app import main as main_module
+
+    importlib.reload(main_module)
+    release = threading.Event()
+    with TestClient(main_module.app) as client:
+        blocker = main_module.inference_executor.submit(release.wait, 5)
+        try:
+            payload = {"text": "Reset my password", "top_k": 3, "min_confidence": 0.55}
+            response = client.post("/predict", json=payload)
+            assert response.status_code == 503
+            assert response.headers["Retry-After"] == "1"
+            assert "queue is full" in response.json()["detail"].lower()
+        finally:
+            release.set()
+            blocker.result(timeout=5)
+        response = client.post("/predict", json=payload)
+        assert response.status_code == 200
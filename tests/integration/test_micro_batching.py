@@ -0,0 +1,24 @@
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def test_predict_with_batching_enabled(monkeypatch: pytest.MonkeyPatch, model_dir) -> None:
+    monkeypatch.setenv("MODEL_DIR", str(model_dir))
+    monkeypatch.setenv("BATCH_ENABLED", "true")
+    monkeypatch.setenv("BATCH_MAX_WAIT_MS", "1")
+    from app import main as main_module
+
+    importlib.reload(main_module)
+    with TestClient(main_module.app) as client:
+        payload = {"text": "refund my card", "top_k": 2, "min_confidence": 0.0}
+        response = client.post("/predict", json=payload)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["needs_human"] is False
+        assert len(body["alternatives"]) == 2
+
+        batching = client.get("/ready").json()["batching"]
+        assert batching["max_wait_ms"] == 1.0
+        assert batching["batch_size"]["count"] == 1
@@ -0,0 +1,81 @@
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.conftest import build_test_model
+
+
+def _registry(tmp_path, names):
+    root = tmp_path / "registry"
+    root.mkdir()
+    for name in names:
+        build_test_model(tmp_path / name).rename(root / name)
+    return root
+
+
+def _client(monkeypatch: pytest.MonkeyPatch, root, max_bytes: int = 1 << 30):
+    monkeypatch.delenv("MODEL_DIR", raising=False)
+    monkeypatch.setenv("MODEL_REGISTRY_DIR", str(root))
+    monkeypatch.setenv("MODEL_REGISTRY_MAX_BYTES", str(max_bytes))
+    from app import main as main_module
+
+    importlib.reload(main_module)
+    return main_module, TestClient(main_module.app)
+
+
+def test_registry_routes_by_path_and_header(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    root = _registry(tmp_path, ["cards", "loans"])
+    main_module, client = _client(monkeypatch, root)
+    payload = {"text": "refund my card", "top_k": 2, "min_confidence": 0.0}
+    with client:
+        assert client.get("/models").json()["models"]["cards"] == {"resident": False}
+
+        response = client.post("/models/cards/predict", json=payload)
+        assert response.status_code == 200
+        assert response.json()["label"] in {"billing", "account"}
+
+        batch = {"items": [{"id": "1", "text": "reset my password"}], "min_confidence": 0.0}
+        response = client.post("/predict_batch", json=batch, headers={"X-Model-Name": "loans"})
+        assert response.status_code == 200
+        assert response.json()["model_version"] == "test"
+
+        assert client.post("/models/missing/predict", json=payload).status_code == 404
+        assert client.post("/models/..%2Fcards/predict", json=payload).status_code == 404
+
+        stats = client.get("/models").json()
+        assert stats["loads"] == 2
+        assert stats["models"]["cards"]["resident"] is True
+        assert stats["models"]["cards"]["load_ms"] >= 0
+        assert stats["models"]["loans"]["avg_load_ms"] >= 0
+
+    # Without a header the default (unloaded) model is used.
+    with TestClient(main_module.app) as client:
+        assert client.post("/predict", json=payload).status_code == 503
+
+
+def test_registry_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    root = _registry(tmp_path, ["a", "b"])
+    main_module, client = _client(monkeypatch, root, max_bytes=1)
+    payload = {"text": "refund my card", "min_confidence": 0.0}
+    with client:
+        assert client.post("/models/a/predict", json=payload).status_code == 200
+        assert client.post("/models/b/predict", json=payload).status_code == 200
+        stats = client.get("/models").json()
+        assert stats["evictions"] == 1
+        assert stats["models"]["a"]["resident"] is False
+        assert stats["models"]["b"]["resident"] is True
+        assert client.post("/models/a/predict", json=payload).status_code == 200
+        assert client.get("/models").json()["models"]["a"]["loads"] == 2
+
+
+def test_models_endpoint_requires_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MODEL_REGISTRY_DIR", raising=False)
+    from app import main as main_module
+
+    importlib.reload(main_module)
+    with TestClient(main_module.app) as client:
+        assert client.get("/models").status_code == 404
+        payload = {"text": "refund my card"}
+        response = client.post("/predict", json=payload, headers={"X-Model-Name": "cards"})
+        assert response.status_code == 404
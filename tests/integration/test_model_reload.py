@@ -0,0 +1,78 @@
+import importlib
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.conftest import build_test_model
+
+
+def _next_model(tmp_path, version: str):
+    model_dir = build_test_model(tmp_path / version)
+    metadata_path = model_dir / "metadata.json"
+    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    metadata["model_version"] = version
+    metadata_path.write_text(json.dumps(metadata), encoding="utf-8")
+    return model_dir
+
+
+def _reload_client(monkeypatch: pytest.MonkeyPatch, model_dir):
+    monkeypatch.setenv("MODEL_DIR", str(model_dir))
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    from app import main as main_module
+
+    importlib.reload(main_module)
+    return main_module
+
+
+def test_admin_reload_swaps_model(monkeypatch: pytest.MonkeyPatch, model_dir, tmp_path) -> None:
+    main_module = _reload_client(monkeypatch, model_dir)
+    new_dir = _next_model(tmp_path, "v2")
+    with TestClient(main_module.app) as client:
+        assert client.get("/health").json()["model_version"] == "test"
+        response = client.post(
+            "/admin/reload",
+            json={"model_dir": str(new_dir)},
+            headers={"X-Admin-Token": "secret"},
+        )
+        assert response.status_code == 202
+        assert response.json()["model_dir"] == str(new_dir)
+        main_module.model_reloader.join(timeout=10)
+
+        health = client.get("/health").json()
+        assert health["model_version"] == "v2"
+        assert health["pending_model_version"] is None
+        ready = client.get("/ready").json()
+        assert ready["reload"]["state"] == "idle"
+        assert ready["reload"]["last_reload_at"] is not None
+        payload = {"text": "refund my card", "top_k": 2, "min_confidence": 0.0}
+        assert client.post("/predict", json=payload).status_code == 200
+
+
+def test_admin_reload_keeps_model_on_failure(
+    monkeypatch: pytest.MonkeyPatch, model_dir, tmp_path
+) -> None:
+    main_module = _reload_client(monkeypatch, model_dir)
+    with TestClient(main_module.app) as client:
+        response = client.post(
+            "/admin/reload",
+            json={"model_dir": str(tmp_path / "missing")},
+            headers={"X-Admin-Token": "secret"},
+        )
+        assert response.status_code == 202
+        main_module.model_reloader.join(timeout=10)
+        ready = client.get("/ready").json()
+        assert ready["model_version"] == "test"
+        assert ready["reload"]["state"] == "failed"
+        assert ready["reload"]["last_error"]
+
+
+def test_admin_reload_requires_token(monkeypatch: pytest.MonkeyPatch, model_dir) -> None:
+    main_module = _reload_client(monkeypatch, model_dir)
+    with TestClient(main_module.app) as client:
+        assert client.post("/admin/reload", headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+    monkeypatch.delenv("ADMIN_TOKEN")
+    importlib.reload(main_module)
+    with TestClient(main_module.app) as client:
+        assert client.post("/admin/reload", headers={"X-Admin-Token": "secret"}).status_code == 404
@@ -0,0 +1,75 @@
+import importlib
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def _client(monkeypatch: pytest.MonkeyPatch, model_dir, chunk_size: int = 2) -> TestClient:
+    monkeypatch.setenv("MODEL_DIR", str(model_dir))
+    monkeypatch.setenv("STREAM_CHUNK_SIZE", str(chunk_size))
+    from app import main as main_module
+
+    importlib.reload(main_module)
+    return main_module, TestClient(main_module.app)
+
+
+def test_predict_stream_scores_ndjson_in_chunks(
+    monkeypatch: pytest.MonkeyPatch, model_dir, caplog
+) -> None:
+    caplog.set_level("INFO")
+    main_module, client = _client(monkeypatch, model_dir)
+    body = "\n".join(
+        [
+            json.dumps({"id": "1", "text": "refund my card"}),
+            json.dumps({"id": "2", "text": "reset my password"}),
+            "",
+            json.dumps({"id": "3", "text": "   "}),
+            json.dumps({"id": "4", "text": "change account email"}),
+        ]
+    )
+
+    def body_chunks():
+        for start in range(0, len(body), 7):
+            yield body[start : start + 7].encode("utf-8")
+
+    with client:
+        response = client.post(
+            "/predict_stream?min_confidence=0.0",
+            content=body_chunks(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    results = [line for line in lines if "label" in line]
+    errors = [line for line in lines if "error" in line]
+    assert [result["id"] for result in results] == ["1", "2", "4"]
+    assert all(result["needs_human"] is False for result in results)
+    assert errors == [{"line": 4, "error": errors[0]["error"]}]
+
+    events = [json.loads(record.getMessage()) for record in caplog.records]
+    stream_event = next(event for event in events if event.get("event") == "prediction_stream")
+    assert stream_event["item_count"] == 3
+    assert stream_event["chunk_count"] == 2
+    assert stream_event["error_count"] == 1
+
+
+def test_predict_stream_rejects_overlong_line(monkeypatch: pytest.MonkeyPatch, model_dir) -> None:
+    monkeypatch.setenv("MAX_BODY_BYTES", "64")
+    main_module, client = _client(monkeypatch, model_dir)
+    body = json.dumps({"id": "1", "text": "x" * 200})
+    with client:
+        response = client.post("/predict_stream", content=body.encode("utf-8"))
+    assert response.status_code == 200
+    assert json.loads(response.text.splitlines()[-1])["error"] == "Line too long"
+
+
+def test_predict_stream_requires_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MODEL_DIR", raising=False)
+    from app import main as main_module
+
+    importlib.reload(main_module)
+    with TestClient(main_module.app) as client:
+        response = client.post("/predict_stream", content=b'{"id": "1", "text": "hi"}\n')
+    assert response.status_code == 503
@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+from app.services.executor import InferenceExecutor, QueueFullError
+
+
+def test_executor_rejects_when_full() -> None:
+    executor = InferenceExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking() -> str:
+        started.set()
+        release.wait(timeout=5)
+        return "done"
+
+    try:
+        running = executor.submit(blocking)
+        assert started.wait(timeout=5)
+        queued = executor.submit(lambda: "queued")
+        assert executor.in_flight == 1
+        assert executor.queue_depth == 1
+        with pytest.raises(QueueFullError):
+            executor.submit(lambda: "rejected")
+        release.set()
+        assert running.result(timeout=5) == "done"
+        assert queued.result(timeout=5) == "queued"
+    finally:
+        release.set()
+        executor.shutdown()
+    assert executor.in_flight == 0
+    assert executor.queue_depth == 0
+
+
+def test_executor_restarts_after_shutdown() -> None:
+    executor = InferenceExecutor(max_workers=2, max_queue=0)
+    assert executor.submit(lambda: 1).result(timeout=5) == 1
+    executor.shutdown()
+    assert executor.submit(lambda: 2).result(timeout=5) == 2
+    executor.shutdown()
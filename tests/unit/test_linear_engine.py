@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from app.services.engine import LinearEngine, MappedVocabulary, compile_engine
+from app.services.predictor import Predictor
+
+TEXTS = [
+    "refund my card please",
+    "reset my password now",
+    "refund charged twice",
+    "change account email",
+    "where is my card",
+    "card arrived broken",
+]
+QUERIES = ["my card refund", "nothing known", "Reset the PASSWORD of my account email", ""]
+
+
+@pytest.mark.parametrize(
+    "vectorizer_kwargs",
+    [
+        {"ngram_range": (1, 2)},
+        {"ngram_range": (1, 3), "sublinear_tf": True, "stop_words": "english"},
+        {"ngram_range": (2, 2), "norm": "l1"},
+    ],
+)
+@pytest.mark.parametrize("labels", [[0, 1, 0, 1, 2, 2], [0, 1, 0, 1, 1, 0]])
+def test_engine_matches_sklearn(vectorizer_kwargs, labels) -> None:
+    vectorizer = TfidfVectorizer(**vectorizer_kwargs)
+    model = LogisticRegression(max_iter=500).fit(vectorizer.fit_transform(TEXTS), labels)
+    engine = compile_engine(vectorizer, model)
+    expected = model.predict_proba(vectorizer.transform(QUERIES))
+    np.testing.assert_allclose(engine.predict_proba(QUERIES), expected, atol=1e-5)
+
+
+def test_engine_round_trips_without_pickle(tmp_path) -> None:
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2))
+    model = LogisticRegression(max_iter=500).fit(
+        vectorizer.fit_transform(TEXTS), [0, 1, 0, 1, 2, 2]
+    )
+    engine = compile_engine(vectorizer, model)
+    engine.save(tmp_path)
+    restored = LinearEngine.load(tmp_path)
+    assert isinstance(restored.vocabulary, MappedVocabulary)
+    assert isinstance(restored.coef, np.memmap)
+    assert len(restored.vocabulary) == len(vectorizer.vocabulary_)
+    for term, column in vectorizer.vocabulary_.items():
+        assert restored.vocabulary.get(term) == column
+    assert restored.vocabulary.get("not in vocabulary") is None
+    np.testing.assert_allclose(
+        restored.predict_proba(QUERIES), engine.predict_proba(QUERIES), atol=1e-7
+    )
+
+
+def test_predictor_compiled_backend(model_dir) -> None:
+    sklearn_predictor = Predictor(backend="sklearn")
+    sklearn_predictor.load(str(model_dir))
+    compiled = Predictor(backend="compiled")
+    compiled.load(str(model_dir))
+    assert compiled.backend == "compiled"
+    texts = ["refund my card", "reset my password"]
+    expected = sklearn_predictor.predict(texts, top_k=2, min_confidence=0.0)
+    actual = compiled.predict(texts, top_k=2, min_confidence=0.0)
+    for want, got in zip(expected, actual):
+        assert got["label"] == want["label"]
+        assert got["confidence"] == pytest.approx(want["confidence"], abs=1e-5)
+
+
+def test_predictor_loads_engine_without_pickles(model_dir) -> None:
+    reference = Predictor(backend="sklearn")
+    reference.load(str(model_dir))
+    compiled = Predictor(backend="compiled")
+    compiled.load(str(model_dir))
+    compiled._bundle.engine.save(model_dir)
+    (model_dir / "model.pkl").unlink()
+    (model_dir / "vectorizer.pkl").unlink()
+
+    predictor = Predictor()
+    predictor.load(str(model_dir))
+    assert predictor.backend == "compiled"
+    expected = reference.predict(["refund my card"], top_k=2, min_confidence=0.0)
+    actual = predictor.predict(["refund my card"], top_k=2, min_confidence=0.0)
+    assert actual[0]["label"] == expected[0]["label"]
+    assert actual[0]["confidence"] == pytest.approx(expected[0]["confidence"], abs=1e-5)
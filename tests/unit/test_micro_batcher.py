@@ -0,0 +1,46 @@
+import threading
+
+from app.services.batcher import MicroBatcher
+
+
+class RecordingPredictor:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+        self.lock = threading.Lock()
+
+    def predict(self, texts, top_k=3, min_confidence=0.55):
+        with self.lock:
+            self.calls.append(list(texts))
+        return [{"label": text, "top_k": top_k} for text in texts]
+
+
+def test_batcher_coalesces_concurrent_requests() -> None:
+    predictor = RecordingPredictor()
+    batcher = MicroBatcher(predictor, max_batch_size=8, max_wait_ms=200, max_pending=64)
+    try:
+        futures = [batcher.submit(f"text-{idx}", top_k=3, min_confidence=0.5) for idx in range(8)]
+        results = [future.result(timeout=5) for future in futures]
+    finally:
+        batcher.shutdown()
+    assert [result["label"] for result in results] == [f"text-{idx}" for idx in range(8)]
+    assert len(predictor.calls) == 1
+    stats = batcher.stats()
+    assert stats["batch_size"]["count"] == 1
+    assert stats["wait_ms"]["count"] == 8
+
+
+def test_batcher_groups_by_parameters() -> None:
+    predictor = RecordingPredictor()
+    batcher = MicroBatcher(predictor, max_batch_size=4, max_wait_ms=200, max_pending=64)
+    try:
+        first = batcher.submit("a", top_k=1, min_confidence=0.5)
+        second = batcher.submit("b", top_k=2, min_confidence=0.5)
+        third = batcher.submit("c", top_k=1, min_confidence=0.5)
+        fourth = batcher.submit("d", top_k=2, min_confidence=0.5)
+        assert first.result(timeout=5)["top_k"] == 1
+        assert second.result(timeout=5)["top_k"] == 2
+        assert third.result(timeout=5)["top_k"] == 1
+        assert fourth.result(timeout=5)["top_k"] == 2
+    finally:
+        batcher.shutdown()
+    assert sorted(predictor.calls) == [["a", "c"], ["b", "d"]]
@@ -0,0 +1,37 @@
+import time
+
+from app.services.predictor import Predictor
+from app.services.reloader import ModelReloader
+
+
+def test_swap_lets_in_flight_requests_finish_on_old_bundle(model_dir) -> None:
+    predictor = Predictor()
+    predictor.load(str(model_dir))
+    old_bundle = predictor.bundle
+
+    reloader = ModelReloader(predictor)
+    new_bundle = reloader.reload(str(model_dir))
+
+    assert predictor.bundle is new_bundle
+    assert new_bundle.generation > old_bundle.generation
+    results = predictor.predict(["refund my card"], min_confidence=0.0, bundle=old_bundle)
+    assert results[0]["label"] in {"billing", "account"}
+
+
+def test_watch_reloads_when_model_dir_changes(model_dir) -> None:
+    predictor = Predictor()
+    predictor.load(str(model_dir))
+    first_generation = predictor.bundle.generation
+    reloader = ModelReloader(predictor)
+    reloader.watch(str(model_dir), interval_seconds=0.01)
+    try:
+        metadata_path = model_dir / "metadata.json"
+        metadata_path.write_text('{"model_version": "watched"}', encoding="utf-8")
+        for _ in range(500):
+            if predictor.model_version == "watched":
+                break
+            time.sleep(0.01)
+    finally:
+        reloader.stop()
+    assert predictor.model_version == "watched"
+    assert predictor.bundle.generation > first_generation
@@ -0,0 +1,49 @@
+import numpy as np
+
+from app.services.predictor import PredictionCache, Predictor
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    indices = np.arange(3)
+    scores = np.array([0.5, 0.3, 0.2])
+    entry_size = len("a") + indices.nbytes + scores.nbytes + 200
+    cache = PredictionCache(max_bytes=entry_size * 2)
+    cache.put(("v1", "a"), indices, scores)
+    cache.put(("v1", "b"), indices, scores)
+    assert cache.get(("v1", "a")) is not None
+    cache.put(("v1", "c"), indices, scores)
+    assert cache.get(("v1", "b")) is None
+    assert cache.get(("v1", "a")) is not None
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_cache_expires_entries(monkeypatch) -> None:
+    clock = iter([100.0, 200.0])
+    monkeypatch.setattr("app.services.predictor.time.monotonic", lambda: next(clock))
+    cache = PredictionCache(max_bytes=10_000, ttl_seconds=10)
+    cache.put(("v1", "a"), np.arange(3), np.zeros(3))
+    assert cache.get(("v1", "a")) is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_predictor_serves_repeats_from_cache(model_dir) -> None:
+    predictor = Predictor(cache=PredictionCache(max_bytes=1_000_000))
+    predictor.load(str(model_dir))
+    uncached = Predictor()
+    uncached.load(str(model_dir))
+    texts = ["refund my card", "Refund   my card", "reset my password"]
+
+    first = predictor.predict(texts, top_k=2, min_confidence=0.0)
+    assert first == uncached.predict(texts, top_k=2, min_confidence=0.0)
+    assert predictor.cache.stats()["entries"] == 2
+
+    second = predictor.predict(texts, top_k=1, min_confidence=0.99)
+    assert second == uncached.predict(texts, top_k=1, min_confidence=0.99)
+    assert predictor.cache.stats()["hits"] == 3
+
+    predictor.load(str(model_dir))
+    assert predictor.cache.stats()["entries"] == 0
@@ -0,0 +1,28 @@
+import numpy as np
+
+from app.services.predictor import build_results, select_top_k
+
+
+def test_select_top_k_matches_full_sort() -> None:
+    rng = np.random.default_rng(7)
+    probabilities = rng.random((50, 77))
+    for k in (1, 3, 77):
+        indices, scores = select_top_k(probabilities, k)
+        expected = np.argsort(probabilities, axis=1)[:, ::-1][:, :k]
+        np.testing.assert_array_equal(indices, expected)
+        np.testing.assert_array_equal(scores, np.take_along_axis(probabilities, expected, axis=1))
+
+
+def test_build_results_applies_guardrail() -> None:
+    labels = np.array([["billing", "account"], ["account", "billing"]], dtype=object)
+    scores = np.array([[0.9, 0.1], [0.4, 0.3]])
+    results = build_results(labels, scores, scores[:, 0] < 0.55)
+    assert results[0]["label"] == "billing"
+    assert results[0]["needs_human"] is False
+    assert results[1]["label"] == "human_review"
+    assert results[1]["needs_human"] is True
+    assert results[1]["alternatives"] == [
+        {"label": "account", "confidence": 0.4},
+        {"label": "billing", "confidence": 0.3},
+    ]
+    assert isinstance(results[0]["confidence"], float)
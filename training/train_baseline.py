@@ -11,10 +11,12 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import f1_score
 import sklearn
 
+from app.services.engine import compile_engine
 from training.data import TEST_URL, TRAIN_URL, load_banking77_split
 
 MODEL_VERSION = "0.1.0"
 DEFAULT_MODEL_DIR = Path("artifacts") / f"model_{MODEL_VERSION}"
+ENGINE_TOLERANCE = 1e-4
 
 
 def top_k_accuracy(y_true: np.ndarray, proba: np.ndarray, k: int) -> float:
@@ -77,10 +79,19 @@ def main() -> None:
         "top_k_accuracy": float(top_k_accuracy(y_test, test_proba, k=3)),
     }
 
+    engine = compile_engine(vectorizer, model)
+    engine_max_abs_diff = float(np.abs(engine.predict_proba(X_test) - test_proba).max())
+    if engine_max_abs_diff > ENGINE_TOLERANCE:
+        raise RuntimeError(
+            f"Compiled engine diverges from sklearn by {engine_max_abs_diff:.2e} "
+            f"(tolerance {ENGINE_TOLERANCE:.0e})"
+        )
+
     label_map = {str(idx): label for idx, label in enumerate(label_names)}
 
     joblib.dump(model, model_dir / "model.pkl")
     joblib.dump(vectorizer, model_dir / "vectorizer.pkl")
+    engine.save(model_dir)
     with (model_dir / "label_map.json").open("w", encoding="utf-8") as handle:
         json.dump(label_map, handle, indent=2)
 
@@ -94,6 +105,10 @@ def main() -> None:
         n_test=len(X_test),
         label_encoding=label_encoding,
     )
+    metadata["compiled_engine"] = {
+        "max_abs_diff": engine_max_abs_diff,
+        "tolerance": ENGINE_TOLERANCE,
+    }
     with (model_dir / "metadata.json").open("w", encoding="utf-8") as handle:
         json.dump(metadata, handle, indent=2)
 